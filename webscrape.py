@@ -4,14 +4,18 @@ Flow: landing (letters A–Z) → letter page (players) → player page (intervi
 Output: one CSV per letter (a–z) with resume support and rate limiting.
 """
 
+import asyncio
 import csv
 import re
 import time
+from operator import itemgetter
 from pathlib import Path
 from urllib.parse import urljoin, urlparse, parse_qs
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from hishel import AsyncSqliteStorage, BaseFilter, FilterPolicy, Request, Response
+from hishel.httpx import AsyncCacheTransport
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 
 LANDING_URL = "https://www.asapsports.com/showcat.php?id=2"
@@ -20,9 +24,16 @@ BASE_URL = f"{_landing.scheme}://{_landing.netloc}"
 CATEGORY_ID = parse_qs(_landing.query).get("id", ["2"])[0]
 
 RATE_LIMIT_SEC = 0.3
+MAX_CONCURRENCY = 32
+RETRY_TOTAL = 5
+RETRY_BACKOFF_SEC = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CSV_FLUSH_EVERY = 50
 CSV_DIR = Path(__file__).resolve().parent.parent
 CSV_NAME_PREFIX = "asap_baseball_transcripts"
-CSV_COLUMNS = [
+CACHE_NAME = "asap_cache.db"
+CACHE_TTL_SEC = 86400
+CSV_COLUMNS = (
     "player_name",
     "interview_title",
     "date",
@@ -30,7 +41,69 @@ CSV_COLUMNS = [
     "interview_id",
     "url",
     "transcript",
-]
+)
+# scrape_interview rows always carry every column, so values can be pulled positionally.
+_row_values = itemgetter(*CSV_COLUMNS)
+
+_DATE_RE = re.compile(r"^[A-Z][a-z]+\s+\d{1,2},?\s+\d{4}$")
+_BRACKET_RE = re.compile(r"^\[|\]$")
+_PID_RE = re.compile(r"show_player\.php\?id=(\d+)")
+_IID_RE = re.compile(r"[?&]id=(\d+)")
+_CONTENT_ID_RE = re.compile(r"content|main|transcript", re.I)
+_PARAGRAPH_END_RE = re.compile(r"FastScripts Transcript|ASAP Sports, Inc")
+_TRANSCRIPT_END_RE = re.compile(r"FastScripts Transcript|ASAP Sports, Inc\.")
+_FALLBACK_END_RE = re.compile(r"FastScripts Transcript|ASAP Sports, Inc\.|Subscribe to RSS")
+
+
+class _IndexPageFilter(BaseFilter[Request]):
+    """Cache letter and player pages only; transcripts already persist in the CSVs."""
+
+    def needs_body(self) -> bool:
+        return False
+
+    def apply(self, item: Request, body: bytes | None) -> bool:
+        return "show_player.php" in item.url
+
+
+class _OkResponseFilter(BaseFilter[Response]):
+    """Never cache errors, so retries and reruns hit the network again."""
+
+    def needs_body(self) -> bool:
+        return False
+
+    def apply(self, item: Response, body: bytes | None) -> bool:
+        return item.status_code == 200
+
+
+class TokenBucket:
+    """Space request starts at least `interval` seconds apart, sleeping only for what remains."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.next = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        delay = self.next - now
+        # Reserve the slot before sleeping so concurrent callers queue up behind it.
+        self.next = max(now, self.next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class _ThrottledTransport(httpx.AsyncBaseTransport):
+    """Wait on the token bucket before each request that actually reaches the network."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, bucket: TokenBucket) -> None:
+        self.transport = transport
+        self.bucket = bucket
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.bucket.wait()
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
 
 
 def load_scraped_ids(csv_path: Path) -> set[str]:
@@ -40,24 +113,65 @@ def load_scraped_ids(csv_path: Path) -> set[str]:
     ids = set()
     with open(csv_path, "r", encoding="utf-8", newline="") as f:
         try:
-            reader = csv.DictReader(f)
-            if reader.fieldnames and "interview_id" in reader.fieldnames:
-                for row in reader:
-                    if row.get("interview_id"):
-                        ids.add(row["interview_id"].strip())
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header and "interview_id" in header:
+                idx = header.index("interview_id")
+                # update() keeps the ids read so far if a later row is malformed.
+                ids.update(row[idx].strip() for row in reader if len(row) > idx and row[idx])
         except (csv.Error, UnicodeDecodeError):
             pass
     return ids
 
 
-def get_soup(session: requests.Session, url: str) -> BeautifulSoup | None:
-    """Fetch URL and return BeautifulSoup; None on failure."""
-    try:
-        r = session.get(url, timeout=30)
-        r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
-    except requests.RequestException:
-        return None
+async def get_soup(
+    client: httpx.AsyncClient,
+    url: str,
+    semaphore: asyncio.Semaphore,
+) -> LexborHTMLParser | None:
+    """Fetch URL and return a parsed Lexbor tree; None on failure.
+    Retries request errors (network, decoding, redirects) and 429/5xx with exponential backoff.
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        # Hold a concurrency slot only for the request itself, not for the backoff sleep.
+        async with semaphore:
+            try:
+                r = await client.get(url, timeout=30)
+            except httpx.HTTPError:
+                r = None
+        if r is not None and r.status_code not in RETRY_STATUSES:
+            return _parse_response(r) if r.is_success else None
+        if attempt < RETRY_TOTAL:
+            await asyncio.sleep(RETRY_BACKOFF_SEC * 2 ** attempt)
+    return None
+
+
+def _parse_response(r: httpx.Response) -> LexborHTMLParser:
+    """Parse a response body, honouring the declared charset (header, else <meta>)."""
+    # Lexbor reads bytes as UTF-8, so only other declared charsets need a str decode first.
+    charset = (r.charset_encoding or "").lower()
+    if charset in ("utf-8", "utf8"):
+        return LexborHTMLParser(r.content)
+    if charset:
+        return LexborHTMLParser(r.text)
+    return LexborHTMLParser(r.content, encoding=True)
+
+
+def _find_parent(node: LexborNode, tag: str) -> LexborNode | None:
+    """Nearest ancestor of node with the given tag name."""
+    parent = node.parent
+    while parent is not None and parent.tag != tag:
+        parent = parent.parent
+    return parent
+
+
+def _joined_text(node: LexborNode) -> str:
+    """Non-empty stripped text nodes joined by newlines (BS4's get_text("\n", strip=True))."""
+    return "\n".join(
+        t
+        for n in node.traverse(include_text=True)
+        if n.tag == "-text" and n.parent.tag not in ("script", "style") and (t := n.text_content.strip())
+    )
 
 
 def get_letter_urls() -> list[str]:
@@ -68,53 +182,50 @@ def get_letter_urls() -> list[str]:
     ]
 
 
-def get_player_links(soup: BeautifulSoup) -> list[tuple[str, str]]:
-    """From a letter page soup, return [(player_url, player_name), ...]."""
+def get_player_links(soup: LexborHTMLParser) -> list[tuple[str, str]]:
+    """From a letter page tree, return [(player_url, player_name), ...]."""
     if not soup:
         return []
     seen = set()
     out = []
-    for a in soup.find_all("a", href=True):
-        href = a.get("href", "")
-        if "show_player.php?id=" in href and "letter=" not in href:
-            url = urljoin(BASE_URL, href)
-            name = (a.get_text() or "").strip()
-            if name and url not in seen:
-                seen.add(url)
-                out.append((url, name))
+    for a in soup.css('a[href*="show_player.php?id="]:not([href*="letter="])'):
+        href = a.attributes.get("href") or ""
+        m = _PID_RE.search(href)
+        name = (a.text() or "").strip()
+        if m and name and (pid := int(m.group(1))) not in seen:
+            seen.add(pid)
+            out.append((urljoin(BASE_URL, href), name))
     return out
 
 
-def get_interview_links(soup: BeautifulSoup) -> list[tuple[str, str, str]]:
-    """From a player page soup, return [(interview_url, interview_title, date), ...]. Date from <nobr>[ ... ]</nobr> in same row."""
+def get_interview_links(soup: LexborHTMLParser) -> list[tuple[str, str, str, str]]:
+    """From a player page tree, return [(interview_url, interview_title, date, interview_id), ...]. Date from <nobr>[ ... ]</nobr> in same row."""
     if not soup:
         return []
     out = []
-    for a in soup.find_all("a", href=True):
-        if "show_interview.php?id=" not in a.get("href", ""):
-            continue
-        url = urljoin(BASE_URL, a["href"])
-        title = (a.get_text() or "").strip()
-        if not title:
+    for a in soup.css('a[href*="show_interview.php?id="]'):
+        url = urljoin(BASE_URL, a.attributes.get("href") or "")
+        title = (a.text() or "").strip()
+        iid = parse_interview_id(url)
+        if not title or not iid:
             continue
         date = ""
-        tr = a.find_parent("tr")
+        tr = _find_parent(a, "tr")
         if tr:
-            nobr = tr.find("nobr")
+            nobr = tr.css_first("nobr")
             if nobr:
-                date = re.sub(r"^\[|\]$", "", (nobr.get_text() or "").strip())
-        out.append((url, title, date))
+                date = _BRACKET_RE.sub("", (nobr.text() or "").strip())
+        out.append((url, title, date, iid))
     return out
 
 
 def parse_interview_id(url: str) -> str | None:
     """Extract id from show_interview.php?id=..."""
-    qs = parse_qs(urlparse(url).query)
-    ids = qs.get("id", [])
-    return ids[0] if ids else None
+    m = _IID_RE.search(url)
+    return m.group(1) if m else None
 
 
-def extract_transcript_metadata_and_text(soup: BeautifulSoup) -> dict:
+def extract_transcript_metadata_and_text(soup: LexborHTMLParser) -> dict:
     """Extract event, date, player (fallback) and full transcript."""
     data = {
         "player_name": "",
@@ -126,65 +237,73 @@ def extract_transcript_metadata_and_text(soup: BeautifulSoup) -> dict:
     if not soup:
         return data
 
-    h1 = soup.find("h1")
+    h1 = soup.css_first("h1")
     if h1:
-        data["event"] = (h1.get_text() or "").strip()
+        data["event"] = (h1.text() or "").strip()
         data["interview_title"] = data["event"]
 
-    h2 = soup.find("h2")
+    h2 = soup.css_first("h2")
     if h2:
-        t = (h2.get_text() or "").strip()
-        if re.match(r"^[A-Z][a-z]+\s+\d{1,2},?\s+\d{4}$", t):
+        t = (h2.text() or "").strip()
+        if _DATE_RE.match(t):
             data["date"] = t
 
-    all_h3 = soup.find_all("h3")
+    all_h3 = soup.css("h3")
     for h in all_h3:
-        t = (h.get_text() or "").strip()
+        t = (h.text() or "").strip()
         if not t:
             continue
-        if re.match(r"^[A-Z][a-z]+\s+\d{1,2},?\s+\d{4}$", t):
+        if _DATE_RE.match(t):
             data["date"] = data["date"] or t
         elif not data["player_name"]:
             data["player_name"] = t
             break
 
     # Transcript lives in the same <td> as the main content (h1). Nav/sidebar are elsewhere.
-    main_td = soup.find("h1") and soup.find("h1").find_parent("td")
+    main_td = _find_parent(h1, "td") if h1 else None
     transcript_parts = []
     if main_td:
-        for p in main_td.find_all("p"):
-            text = (p.get_text() or "").strip()
-            if "FastScripts Transcript" in text or "ASAP Sports, Inc" in text:
+        for p in main_td.css("p"):
+            text = (p.text() or "").strip()
+            if _PARAGRAPH_END_RE.search(text):
                 break
             if text:
                 transcript_parts.append(text)
     if not transcript_parts and main_td:
-        text = main_td.get_text(separator="\n", strip=True)
-        for marker in ["FastScripts Transcript", "ASAP Sports, Inc."]:
-            if marker in text:
-                text = text.split(marker)[0]
+        text = _TRANSCRIPT_END_RE.split(_joined_text(main_td), 1)[0]
         transcript_parts = [text.strip()] if text.strip() else []
     data["transcript"] = "\n\n".join(transcript_parts) if transcript_parts else _fallback_transcript_text(soup)
     return data
 
 
-def _fallback_transcript_text(soup: BeautifulSoup) -> str:
+def _fallback_transcript_text(soup: LexborHTMLParser) -> str:
     """Fallback: main content area text, excluding nav/footer."""
-    for tag in soup.find_all(["script", "style", "nav"]):
+    for tag in soup.css("script, style, nav"):
         tag.decompose()
-    main = soup.find(id=re.compile(r"content|main|transcript", re.I)) or soup.find("main")
-    body = main if main else soup.find("body") or soup
+    main = next((n for n in soup.css("[id]") if _CONTENT_ID_RE.search(n.id or "")), None) or soup.css_first("main")
+    body = main if main else soup.body or soup.root
     if not body:
         return ""
-    text = body.get_text(separator="\n", strip=True)
-    for marker in ["FastScripts Transcript", "ASAP Sports, Inc.", "Subscribe to RSS"]:
-        if marker in text:
-            text = text.split(marker)[0]
+    text = _FALLBACK_END_RE.split(_joined_text(body), 1)[0]
     return text.strip()
 
 
-def scrape_interview(
-    session: requests.Session,
+async def scrape_player(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    player_name_from_letter: str,
+) -> tuple[str, list[tuple[str, str, str, str]]]:
+    """Fetch one player page and return (player_name, interview links); the page tree is not kept."""
+    psoup = await get_soup(client, url, semaphore)
+    h = psoup and psoup.css_first("h1")
+    player_name = (h.text() or "").strip() if h else player_name_from_letter
+    return player_name, get_interview_links(psoup)
+
+
+async def scrape_interview(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
     url: str,
     interview_id: str,
     player_name: str,
@@ -192,8 +311,7 @@ def scrape_interview(
     date_from_player_page: str = "",
 ) -> dict | None:
     """Fetch one interview page and return a row dict for CSV. Name/date from player page override when provided."""
-    soup = get_soup(session, url)
-    time.sleep(RATE_LIMIT_SEC)
+    soup = await get_soup(client, url, semaphore)
     if not soup:
         return None
     row = extract_transcript_metadata_and_text(soup)
@@ -205,20 +323,28 @@ def scrape_interview(
     return row
 
 
+async def scrape_first_listing(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    interview_id: str,
+    listings: list[tuple[str, str, str, str]],
+) -> dict | None:
+    """Scrape one interview, trying each (url, player_name, title, date) listing in turn until one succeeds."""
+    for url, player_name, interview_title, date_from_player_page in listings:
+        row = await scrape_interview(
+            client, semaphore, url, interview_id, player_name, interview_title, date_from_player_page
+        )
+        if row:
+            return row
+    return None
+
+
 def ensure_csv_header(csv_path: Path) -> None:
     """Create CSV with header if file doesn't exist or is empty."""
     if csv_path.exists() and csv_path.stat().st_size > 0:
         return
     with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-
-
-def append_row(csv_path: Path, row: dict) -> None:
-    """Append one row to CSV."""
-    with open(csv_path, "a", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writerow(row)
+        csv.writer(f).writerow(CSV_COLUMNS)
 
 
 def run(
@@ -226,46 +352,91 @@ def run(
     rate_limit_sec: float = RATE_LIMIT_SEC,
     resume: bool = True,
     start_letter: str | None = "m",
+    use_cache: bool = True,
+    max_concurrency: int = MAX_CONCURRENCY,
 ) -> None:
     """Full scrape: letters → players → interviews → transcripts. One CSV per letter.
     start_letter: only letters >= this (e.g. "m" → m–z). None = from "a".
+    max_concurrency: page fetches in flight at once; player and interview pages of a letter are fetched concurrently.
+    use_cache: serve letter/player pages from an on-disk cache (csv_dir/CACHE_NAME) for CACHE_TTL_SEC.
     """
-    global RATE_LIMIT_SEC
-    RATE_LIMIT_SEC = rate_limit_sec
-    session = requests.Session()
-    session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; ASAP transcript scraper)"})
+    asyncio.run(_run(csv_dir, rate_limit_sec, resume, start_letter, use_cache, max_concurrency))
+
+
+async def _run(
+    csv_dir: Path,
+    rate_limit_sec: float,
+    resume: bool,
+    start_letter: str | None,
+    use_cache: bool,
+    max_concurrency: int,
+) -> None:
+    """Async body of run()."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # The semaphore caps in-flight fetches, so the pool never needs more connections than that.
+    # Throttling sits under the cache so cached pages are served without waiting on the bucket.
+    transport = _ThrottledTransport(
+        httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=max_concurrency, max_connections=max_concurrency),
+        ),
+        TokenBucket(rate_limit_sec),
+    )
+    if use_cache:
+        transport = AsyncCacheTransport(
+            next_transport=transport,
+            storage=AsyncSqliteStorage(database_path=csv_dir / CACHE_NAME, default_ttl=CACHE_TTL_SEC),
+            policy=FilterPolicy(request_filters=[_IndexPageFilter()], response_filters=[_OkResponseFilter()]),
+        )
+    client = httpx.AsyncClient(
+        transport=transport,
+        headers={
+            "User-Agent": "Mozilla/5.0 (compatible; ASAP transcript scraper)",
+            "Accept-Encoding": "gzip, br",
+        },
+        follow_redirects=True,
+    )
 
     letter_urls = get_letter_urls()
     if start_letter is not None:
         letter_urls = [u for u in letter_urls if parse_qs(urlparse(u).query).get("letter", [""])[0] >= start_letter]
     total_new = 0
-    for letter_url in letter_urls:
-        letter = parse_qs(urlparse(letter_url).query).get("letter", [""])[0]
-        csv_path = csv_dir / f"{CSV_NAME_PREFIX}_{letter}.csv"
-        scraped_ids = load_scraped_ids(csv_path) if resume else set()
-        ensure_csv_header(csv_path)
-
-        soup = get_soup(session, letter_url)
-        time.sleep(RATE_LIMIT_SEC)
-        players = get_player_links(soup)
-        for player_url, player_name_from_letter in players:
-            psoup = get_soup(session, player_url)
-            time.sleep(RATE_LIMIT_SEC)
-            player_name = (psoup.find("h1").get_text() or "").strip() if psoup and psoup.find("h1") else player_name_from_letter
-            interviews = get_interview_links(psoup)
-            for interview_url, interview_title, date_on_player_page in interviews:
-                iid = parse_interview_id(interview_url)
-                if not iid:
-                    continue
-                if iid in scraped_ids:
-                    continue
-                row = scrape_interview(
-                    session, interview_url, iid, player_name, interview_title, date_on_player_page
-                )
-                if row:
-                    append_row(csv_path, row)
-                    scraped_ids.add(iid)
-                    total_new += 1
+    async with client:
+        for letter_url in letter_urls:
+            letter = parse_qs(urlparse(letter_url).query).get("letter", [""])[0]
+            csv_path = csv_dir / f"{CSV_NAME_PREFIX}_{letter}.csv"
+            scraped_ids = load_scraped_ids(csv_path) if resume else set()
+            ensure_csv_header(csv_path)
+
+            soup = await get_soup(client, letter_url, semaphore)
+            players = get_player_links(soup)
+            player_pages = await asyncio.gather(
+                *(scrape_player(client, semaphore, player_url, name) for player_url, name in players)
+            )
+            # One fetch per interview id; players sharing an interview become fallback listings for it.
+            listings: dict[str, list[tuple[str, str, str, str]]] = {}
+            for player_name, interviews in player_pages:
+                for interview_url, interview_title, date_on_player_page, iid in interviews:
+                    if iid in scraped_ids:
+                        continue
+                    listings.setdefault(iid, []).append(
+                        (interview_url, player_name, interview_title, date_on_player_page)
+                    )
+            tasks = [
+                scrape_first_listing(client, semaphore, iid, iid_listings)
+                for iid, iid_listings in listings.items()
+            ]
+            # Rows are written here, one at a time, as each fetch completes; the file stays open for the letter.
+            with open(csv_path, "a", encoding="utf-8", newline="", buffering=1 << 20) as fh:
+                writerow = csv.writer(fh).writerow
+                for next_row in asyncio.as_completed(tasks):
+                    row = await next_row
+                    if row:
+                        writerow(_row_values(row))
+                        scraped_ids.add(row["interview_id"])
+                        total_new += 1
+                        if total_new % CSV_FLUSH_EVERY == 0:
+                            fh.flush()
     print(f"Done. New transcripts written: {total_new}. CSVs: {csv_dir}")
 
 